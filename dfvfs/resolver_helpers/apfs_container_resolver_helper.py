@@ -3,10 +3,14 @@
 
 from __future__ import unicode_literals
 
+# Import the back-end binding here so a missing optional dependency
+# raises an ImportError when this module is imported and the helper
+# is not registered.
+import pyfsapfs  # pylint: disable=unused-import
+
 from dfvfs.lib import definitions
 from dfvfs.resolver_helpers import manager
 from dfvfs.resolver_helpers import resolver_helper
-from dfvfs.vfs import apfs_container_file_system
 
 
 class APFSContainerResolverHelper(resolver_helper.ResolverHelper):
@@ -23,6 +27,9 @@ class APFSContainerResolverHelper(resolver_helper.ResolverHelper):
     Returns:
       APFSContainerFileSystem: file system.
     """
+    # Delay the import to reduce the import time of dfvfs.
+    from dfvfs.vfs import apfs_container_file_system  # pylint: disable=import-outside-toplevel
+
     return apfs_container_file_system.APFSContainerFileSystem(resolver_context)
 
 
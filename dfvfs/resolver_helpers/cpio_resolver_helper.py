@@ -3,11 +3,9 @@
 
 from __future__ import unicode_literals
 
-from dfvfs.file_io import cpio_file_io
 from dfvfs.lib import definitions
 from dfvfs.resolver_helpers import manager
 from dfvfs.resolver_helpers import resolver_helper
-from dfvfs.vfs import cpio_file_system
 
 
 class CPIOResolverHelper(resolver_helper.ResolverHelper):
@@ -24,6 +22,9 @@ class CPIOResolverHelper(resolver_helper.ResolverHelper):
     Returns:
       FileIO: file-like object.
     """
+    # Delay the import to reduce the import time of dfvfs.
+    from dfvfs.file_io import cpio_file_io  # pylint: disable=import-outside-toplevel
+
     return cpio_file_io.CPIOFile(resolver_context)
 
   def NewFileSystem(self, resolver_context):
@@ -35,6 +36,9 @@ class CPIOResolverHelper(resolver_helper.ResolverHelper):
     Returns:
       FileSystem: file system.
     """
+    # Delay the import to reduce the import time of dfvfs.
+    from dfvfs.vfs import cpio_file_system  # pylint: disable=import-outside-toplevel
+
     return cpio_file_system.CPIOFileSystem(resolver_context)
 
 
@@ -3,7 +3,11 @@
 
 from __future__ import unicode_literals
 
-from dfvfs.file_io import ewf_file_io
+# Import the back-end binding here so a missing optional dependency
+# raises an ImportError when this module is imported and the helper
+# is not registered.
+import pyewf  # pylint: disable=unused-import
+
 from dfvfs.lib import definitions
 from dfvfs.resolver_helpers import manager
 from dfvfs.resolver_helpers import resolver_helper
@@ -23,6 +27,9 @@ class EWFResolverHelper(resolver_helper.ResolverHelper):
     Returns:
       FileIO: file-like object.
     """
+    # Delay the import to reduce the import time of dfvfs.
+    from dfvfs.file_io import ewf_file_io  # pylint: disable=import-outside-toplevel
+
     return ewf_file_io.EWFFile(resolver_context)
 
 
@@ -3,11 +3,14 @@
 
 from __future__ import unicode_literals
 
-from dfvfs.file_io import fvde_file_io
+# Import the back-end binding here so a missing optional dependency
+# raises an ImportError when this module is imported and the helper
+# is not registered.
+import pyfvde  # pylint: disable=unused-import
+
 from dfvfs.lib import definitions
 from dfvfs.resolver_helpers import manager
 from dfvfs.resolver_helpers import resolver_helper
-from dfvfs.vfs import fvde_file_system
 
 
 class FVDEResolverHelper(resolver_helper.ResolverHelper):
@@ -24,6 +27,9 @@ class FVDEResolverHelper(resolver_helper.ResolverHelper):
     Returns:
       FVDEFile: file-like object.
     """
+    # Delay the import to reduce the import time of dfvfs.
+    from dfvfs.file_io import fvde_file_io  # pylint: disable=import-outside-toplevel
+
     return fvde_file_io.FVDEFile(resolver_context)
 
   def NewFileSystem(self, resolver_context):
@@ -35,6 +41,9 @@ class FVDEResolverHelper(resolver_helper.ResolverHelper):
     Returns:
       FVDEFileSystem: file system.
     """
+    # Delay the import to reduce the import time of dfvfs.
+    from dfvfs.vfs import fvde_file_system  # pylint: disable=import-outside-toplevel
+
     return fvde_file_system.FVDEFileSystem(resolver_context)
 
 
@@ -3,10 +3,73 @@
 
 from __future__ import unicode_literals
 
+import importlib
+
+from dfvfs.lib import definitions
+
 
 class ResolverHelperManager(object):
   """Path specification resolver helper manager."""
 
+  # Modules that provide a resolver helper per type indicator. The modules
+  # register their helper with the manager on import and are only imported
+  # when the corresponding type indicator is resolved.
+  _RESOLVER_HELPER_MODULES = {
+      definitions.TYPE_INDICATOR_APFS: (
+          'dfvfs.resolver_helpers.apfs_resolver_helper'),
+      definitions.TYPE_INDICATOR_APFS_CONTAINER: (
+          'dfvfs.resolver_helpers.apfs_container_resolver_helper'),
+      definitions.TYPE_INDICATOR_BDE: (
+          'dfvfs.resolver_helpers.bde_resolver_helper'),
+      definitions.TYPE_INDICATOR_COMPRESSED_STREAM: (
+          'dfvfs.resolver_helpers.compressed_stream_resolver_helper'),
+      definitions.TYPE_INDICATOR_CPIO: (
+          'dfvfs.resolver_helpers.cpio_resolver_helper'),
+      definitions.TYPE_INDICATOR_DATA_RANGE: (
+          'dfvfs.resolver_helpers.data_range_resolver_helper'),
+      definitions.TYPE_INDICATOR_ENCODED_STREAM: (
+          'dfvfs.resolver_helpers.encoded_stream_resolver_helper'),
+      definitions.TYPE_INDICATOR_ENCRYPTED_STREAM: (
+          'dfvfs.resolver_helpers.encrypted_stream_resolver_helper'),
+      definitions.TYPE_INDICATOR_EWF: (
+          'dfvfs.resolver_helpers.ewf_resolver_helper'),
+      definitions.TYPE_INDICATOR_EXT: (
+          'dfvfs.resolver_helpers.ext_resolver_helper'),
+      definitions.TYPE_INDICATOR_FAKE: (
+          'dfvfs.resolver_helpers.fake_resolver_helper'),
+      definitions.TYPE_INDICATOR_FVDE: (
+          'dfvfs.resolver_helpers.fvde_resolver_helper'),
+      definitions.TYPE_INDICATOR_GZIP: (
+          'dfvfs.resolver_helpers.gzip_resolver_helper'),
+      definitions.TYPE_INDICATOR_LUKSDE: (
+          'dfvfs.resolver_helpers.luksde_resolver_helper'),
+      definitions.TYPE_INDICATOR_LVM: (
+          'dfvfs.resolver_helpers.lvm_resolver_helper'),
+      definitions.TYPE_INDICATOR_NTFS: (
+          'dfvfs.resolver_helpers.ntfs_resolver_helper'),
+      definitions.TYPE_INDICATOR_OS: (
+          'dfvfs.resolver_helpers.os_resolver_helper'),
+      definitions.TYPE_INDICATOR_QCOW: (
+          'dfvfs.resolver_helpers.qcow_resolver_helper'),
+      definitions.TYPE_INDICATOR_RAW: (
+          'dfvfs.resolver_helpers.raw_resolver_helper'),
+      definitions.TYPE_INDICATOR_SQLITE_BLOB: (
+          'dfvfs.resolver_helpers.sqlite_blob_resolver_helper'),
+      definitions.TYPE_INDICATOR_TAR: (
+          'dfvfs.resolver_helpers.tar_resolver_helper'),
+      definitions.TYPE_INDICATOR_TSK: (
+          'dfvfs.resolver_helpers.tsk_resolver_helper'),
+      definitions.TYPE_INDICATOR_TSK_PARTITION: (
+          'dfvfs.resolver_helpers.tsk_partition_resolver_helper'),
+      definitions.TYPE_INDICATOR_VHDI: (
+          'dfvfs.resolver_helpers.vhdi_resolver_helper'),
+      definitions.TYPE_INDICATOR_VMDK: (
+          'dfvfs.resolver_helpers.vmdk_resolver_helper'),
+      definitions.TYPE_INDICATOR_VSHADOW: (
+          'dfvfs.resolver_helpers.vshadow_resolver_helper'),
+      definitions.TYPE_INDICATOR_ZIP: (
+          'dfvfs.resolver_helpers.zip_resolver_helper')}
+
   _resolver_helpers = {}
 
   @classmethod
@@ -41,6 +104,20 @@ class ResolverHelperManager(object):
       KeyError: if resolver helper is not set for the corresponding type
           indicator.
     """
+    if type_indicator not in cls._resolver_helpers:
+      helper_module_name = cls._RESOLVER_HELPER_MODULES.get(
+          type_indicator, None)
+      if helper_module_name:
+        try:
+          # Importing the module registers its resolver helper with
+          # the manager.
+          importlib.import_module(helper_module_name)
+        except ImportError:
+          # The back-end binding of the helper is not available, hence
+          # the type indicator is not supported on this install and the
+          # KeyError below is raised.
+          pass
+
     if type_indicator not in cls._resolver_helpers:
       raise KeyError(
           'Resolver helper not set for type indicator: {0:s}.'.format(
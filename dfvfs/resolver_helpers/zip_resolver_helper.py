@@ -3,11 +3,9 @@
 
 from __future__ import unicode_literals
 
-from dfvfs.file_io import zip_file_io
 from dfvfs.lib import definitions
 from dfvfs.resolver_helpers import manager
 from dfvfs.resolver_helpers import resolver_helper
-from dfvfs.vfs import zip_file_system
 
 
 class ZipResolverHelper(resolver_helper.ResolverHelper):
@@ -24,6 +22,9 @@ class ZipResolverHelper(resolver_helper.ResolverHelper):
     Returns:
       FileIO: file-like object.
     """
+    # Delay the import to reduce the import time of dfvfs.
+    from dfvfs.file_io import zip_file_io  # pylint: disable=import-outside-toplevel
+
     return zip_file_io.ZipFile(resolver_context)
 
   def NewFileSystem(self, resolver_context):
@@ -35,6 +36,9 @@ class ZipResolverHelper(resolver_helper.ResolverHelper):
     Returns:
       FileSystem: file system.
     """
+    # Delay the import to reduce the import time of dfvfs.
+    from dfvfs.vfs import zip_file_system  # pylint: disable=import-outside-toplevel
+
     return zip_file_system.ZipFileSystem(resolver_context)
 
 
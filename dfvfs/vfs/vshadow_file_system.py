@@ -3,6 +3,8 @@
 
 from __future__ import unicode_literals
 
+import collections
+
 import pyvshadow
 
 from dfvfs.lib import definitions
@@ -20,6 +22,8 @@ class VShadowFileSystem(file_system.FileSystem):
   LOCATION_ROOT = '/'
   TYPE_INDICATOR = definitions.TYPE_INDICATOR_VSHADOW
 
+  _MAXIMUM_NUMBER_OF_CACHED_FILE_ENTRIES = 256
+
   def __init__(self, resolver_context):
     """Initializes a file system.
 
@@ -27,9 +31,25 @@ class VShadowFileSystem(file_system.FileSystem):
       resolver_context (Context): resolver context.
     """
     super(VShadowFileSystem, self).__init__(resolver_context)
+    self._file_entry_cache = collections.OrderedDict()
     self._file_object = None
     self._vshadow_volume = None
 
+  def _CacheFileEntry(self, path_spec, file_entry):
+    """Caches a file entry based on a path specification.
+
+    The cache is a least recently used (LRU) cache of bounded size, where
+    the least recently cached file entry is removed first.
+
+    Args:
+      path_spec (PathSpec): path specification.
+      file_entry (VShadowFileEntry): file entry.
+    """
+    self._file_entry_cache[path_spec.comparable] = file_entry
+    if len(self._file_entry_cache) > (
+        self._MAXIMUM_NUMBER_OF_CACHED_FILE_ENTRIES):
+      self._file_entry_cache.popitem(last=False)
+
   def _Close(self):
     """Closes the file system.
 
@@ -42,6 +62,23 @@ class VShadowFileSystem(file_system.FileSystem):
     self._file_object.close()
     self._file_object = None
 
+    self._file_entry_cache.clear()
+
+  def _GetCachedFileEntry(self, path_spec):
+    """Retrieves a cached file entry defined by path specification.
+
+    Args:
+      path_spec (PathSpec): path specification.
+
+    Returns:
+      VShadowFileEntry: a file entry or None if not cached.
+    """
+    file_entry = self._file_entry_cache.get(path_spec.comparable, None)
+    if file_entry is not None:
+      self._file_entry_cache.move_to_end(path_spec.comparable)
+
+    return file_entry
+
   def _Open(self, path_spec, mode='rb'):
     """Opens the file system object defined by path specification.
 
@@ -82,6 +119,9 @@ class VShadowFileSystem(file_system.FileSystem):
     Returns:
       bool: True if the file entry exists.
     """
+    if self._GetCachedFileEntry(path_spec):
+      return True
+
     store_index = vshadow.VShadowPathSpecGetStoreIndex(path_spec)
 
     # The virtual root file has not corresponding store index but
@@ -101,6 +141,10 @@ class VShadowFileSystem(file_system.FileSystem):
     Returns:
       VShadowFileEntry: file entry or None if not available.
     """
+    file_entry = self._GetCachedFileEntry(path_spec)
+    if file_entry:
+      return file_entry
+
     store_index = vshadow.VShadowPathSpecGetStoreIndex(path_spec)
 
     # The virtual root file has not corresponding store index but
@@ -110,15 +154,18 @@ class VShadowFileSystem(file_system.FileSystem):
       if location is None or location != self.LOCATION_ROOT:
         return None
 
-      return vshadow_file_entry.VShadowFileEntry(
+      file_entry = vshadow_file_entry.VShadowFileEntry(
           self._resolver_context, self, path_spec, is_root=True,
           is_virtual=True)
 
-    if store_index < 0 or store_index >= self._vshadow_volume.number_of_stores:
-      return None
+    elif 0 <= store_index < self._vshadow_volume.number_of_stores:
+      file_entry = vshadow_file_entry.VShadowFileEntry(
+          self._resolver_context, self, path_spec)
+
+    if file_entry:
+      self._CacheFileEntry(path_spec, file_entry)
 
-    return vshadow_file_entry.VShadowFileEntry(
-        self._resolver_context, self, path_spec)
+    return file_entry
 
   def GetRootFileEntry(self):
     """Retrieves the root file entry.
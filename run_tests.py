@@ -4,6 +4,9 @@
 
 from __future__ import print_function
 
+import argparse
+import concurrent.futures
+import os
 import sys
 import unittest
 
@@ -16,19 +19,61 @@ import utils.dependencies  # pylint: disable=wrong-import-position
 if __name__ == '__main__':
   print('Using Python version {0!s}'.format(sys.version))
 
-  fail_unless_has_test_file = '--fail-unless-has-test-file' in sys.argv
-  setattr(unittest, 'fail_unless_has_test_file', fail_unless_has_test_file)
-  if fail_unless_has_test_file:
-    # Remove --fail-unless-has-test-file otherwise it will conflict with
-    # the argparse tests.
-    sys.argv.remove('--fail-unless-has-test-file')
+  argument_parser = argparse.ArgumentParser(description='Runs the tests.')
 
-  dependency_helper = utils.dependencies.DependencyHelper()
+  argument_parser.add_argument(
+      '--fail-unless-has-test-file', dest='fail_unless_has_test_file',
+      action='store_true', default=False, help=(
+          'fail a test when its test file is missing.'))
 
-  if not dependency_helper.CheckTestDependencies():
+  argument_parser.add_argument(
+      '--no-deps', dest='no_dependency_check', action='store_true',
+      default=False, help='skip checking the test dependencies.')
+
+  argument_parser.add_argument(
+      '-p', '--pattern', dest='pattern', action='store', default='*.py',
+      metavar='PATTERN', help=(
+          'pattern used by test discovery to match test files.'))
+
+  options, unknown_arguments = argument_parser.parse_known_args()
+
+  # Remove the arguments handled here otherwise they will conflict with
+  # the argparse tests.
+  sys.argv = sys.argv[:1] + unknown_arguments
+
+  setattr(
+      unittest, 'fail_unless_has_test_file', options.fail_unless_has_test_file)
+
+  skip_dependency_check = options.no_dependency_check or (
+      os.environ.get('DFVFS_SKIP_DEPS', '') == '1')
+
+  # Run the dependency check on a worker thread so it overlaps with the
+  # discovery of the tests, which is an independent import scan.
+  dependency_check = None
+  if not skip_dependency_check:
+    dependency_helper = utils.dependencies.DependencyHelper()
+
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    dependency_check = executor.submit(
+        dependency_helper.CheckTestDependencies)
+
+  test_suite = unittest.TestLoader().discover(
+      'tests', pattern=options.pattern)
+
+  if dependency_check and not dependency_check.result():
     sys.exit(1)
 
-  test_suite = unittest.TestLoader().discover('tests', pattern='*.py')
+  # Run the tests in parallel when a concurrent test runner is available,
+  # since the tests are mostly I/O bound on parsing the test images.
+  try:
+    import concurrencytest  # pylint: disable=wrong-import-position
+
+    test_suite = concurrencytest.ConcurrentTestSuite(
+        test_suite, concurrencytest.fork_for_tests(4))
+
+  except ImportError:
+    pass
+
   test_results = unittest.TextTestRunner(verbosity=2).run(test_suite)
   if not test_results.wasSuccessful():
     sys.exit(1)
@@ -10,6 +10,7 @@ import abc
 import argparse
 import configparser
 import difflib
+import itertools
 import logging
 import os
 import shutil
@@ -462,22 +463,30 @@ class ExampleScriptTestCase(TestCase):
             reference_output_file_path))
         return False
 
+      # First compare the files line by line, which streams the files and
+      # stops on the first difference. Only when a difference was found are
+      # the files read into memory to generate a diff of the differences.
+      files_differ = False
       with open(reference_output_file_path, 'r') as reference_output_file:
         with open(output_file_path, 'r') as output_file:
-          reference_output_list = reference_output_file.readlines()
-          output_list = output_file.readlines()
-          differences = list(difflib.unified_diff(
-              reference_output_list, output_list,
-              fromfile=reference_output_file_path, tofile=output_file_path))
-
-      if differences:
-        differences_output = []
-        for difference in differences:
-          differences_output.append(difference)
-        differences_output = '\n'.join(differences_output)
+          sentinel = object()
+          for reference_line, output_line in itertools.zip_longest(
+              reference_output_file, output_file, fillvalue=sentinel):
+            if reference_line != output_line:
+              files_differ = True
+              break
+
+      if files_differ:
+        with open(reference_output_file_path, 'r') as reference_output_file:
+          with open(output_file_path, 'r') as output_file:
+            differences = list(difflib.unified_diff(
+                reference_output_file.readlines(), output_file.readlines(),
+                fromfile=reference_output_file_path, tofile=output_file_path))
+
+        differences_output = '\n'.join(differences)
         logging.error('Differences: {0:s}'.format(differences_output))
 
-      if not differences:
+      else:
         result = True
 
     return result
@@ -4,6 +4,7 @@
 
 from __future__ import unicode_literals
 
+import os
 import unittest
 
 from dfvfs.path import os_path_spec
@@ -18,16 +19,55 @@ from tests import test_lib as shared_test_lib
 class VShadowFileSystemTest(shared_test_lib.BaseTestCase):
   """Tests the Volume Shadow Snapshot (VSS) file system."""
 
-  def setUp(self):
-    """Sets up the needed objects used throughout the test."""
-    self._resolver_context = context.Context()
-    test_file = self._GetTestFilePath(['vsstest.qcow2'])
-    self._SkipIfPathNotExists(test_file)
+  @classmethod
+  def setUpClass(cls):
+    """Sets up the needed objects shared by the tests.
+
+    The file system is opened once and shared between the tests, since
+    opening a VSS volume requires pyvshadow to rebuild the store block
+    maps, which dominates the run time of the individual tests.
+    """
+    cls._resolver_context = context.Context()
+    test_file = os.path.join(shared_test_lib.TEST_DATA_PATH, 'vsstest.qcow2')
+    if not os.path.exists(test_file):
+      raise unittest.SkipTest('missing test file: vsstest.qcow2')
+
+    # Advise the operating system to read the test file into the page cache,
+    # so that pyvshadow does not wait on disk for the QCOW2 cluster table
+    # walks while building the store block maps.
+    if hasattr(os, 'posix_fadvise'):
+      file_descriptor = os.open(test_file, os.O_RDONLY)
+      try:
+        os.posix_fadvise(file_descriptor, 0, 0, os.POSIX_FADV_WILLNEED)
+      finally:
+        os.close(file_descriptor)
 
     path_spec = os_path_spec.OSPathSpec(location=test_file)
-    self._qcow_path_spec = qcow_path_spec.QCOWPathSpec(parent=path_spec)
-    self._vshadow_path_spec = vshadow_path_spec.VShadowPathSpec(
-        location='/', parent=self._qcow_path_spec)
+    cls._qcow_path_spec = qcow_path_spec.QCOWPathSpec(parent=path_spec)
+    cls._vshadow_path_spec = vshadow_path_spec.VShadowPathSpec(
+        location='/', parent=cls._qcow_path_spec)
+
+    # Path specifications are immutable value objects, hence the ones used
+    # by multiple tests are created once and shared.
+    cls._vshadow_path_spec_store1 = vshadow_path_spec.VShadowPathSpec(
+        parent=cls._qcow_path_spec, store_index=1)
+    cls._vshadow_path_spec_store9 = vshadow_path_spec.VShadowPathSpec(
+        parent=cls._qcow_path_spec, store_index=9)
+    cls._vshadow_path_spec_vss0 = vshadow_path_spec.VShadowPathSpec(
+        location='/vss0', parent=cls._qcow_path_spec)
+    cls._vshadow_path_spec_vss2 = vshadow_path_spec.VShadowPathSpec(
+        location='/vss2', parent=cls._qcow_path_spec)
+    cls._vshadow_path_spec_vss9 = vshadow_path_spec.VShadowPathSpec(
+        location='/vss9', parent=cls._qcow_path_spec)
+
+    cls._file_system = vshadow_file_system.VShadowFileSystem(
+        cls._resolver_context)
+    cls._file_system.Open(cls._vshadow_path_spec)
+
+  @classmethod
+  def tearDownClass(cls):
+    """Cleans up the objects shared by the tests."""
+    cls._file_system.Close()
 
   # qcowmount test_data/vsstest.qcow2 fuse/
   # vshadowinfo fuse/qcow1
@@ -63,99 +103,70 @@ class VShadowFileSystemTest(shared_test_lib.BaseTestCase):
 
   def testFileEntryExistsByPathSpec(self):
     """Test the file entry exists by path specification functionality."""
-    file_system = vshadow_file_system.VShadowFileSystem(self._resolver_context)
+    file_system = self._file_system
     self.assertIsNotNone(file_system)
 
-    file_system.Open(self._vshadow_path_spec)
-
-    path_spec = vshadow_path_spec.VShadowPathSpec(
-        location='/', parent=self._qcow_path_spec)
-    self.assertTrue(file_system.FileEntryExistsByPathSpec(path_spec))
-
-    path_spec = vshadow_path_spec.VShadowPathSpec(
-        parent=self._qcow_path_spec, store_index=1)
-    self.assertTrue(file_system.FileEntryExistsByPathSpec(path_spec))
-
-    path_spec = vshadow_path_spec.VShadowPathSpec(
-        location='/vss2', parent=self._qcow_path_spec)
-    self.assertTrue(file_system.FileEntryExistsByPathSpec(path_spec))
+    self.assertTrue(file_system.FileEntryExistsByPathSpec(
+        self._vshadow_path_spec))
+    self.assertTrue(file_system.FileEntryExistsByPathSpec(
+        self._vshadow_path_spec_store1))
+    self.assertTrue(file_system.FileEntryExistsByPathSpec(
+        self._vshadow_path_spec_vss2))
 
-    path_spec = vshadow_path_spec.VShadowPathSpec(
-        parent=self._qcow_path_spec, store_index=9)
-    self.assertFalse(file_system.FileEntryExistsByPathSpec(path_spec))
-
-    path_spec = vshadow_path_spec.VShadowPathSpec(
-        location='/vss0', parent=self._qcow_path_spec)
-    self.assertFalse(file_system.FileEntryExistsByPathSpec(path_spec))
-
-    path_spec = vshadow_path_spec.VShadowPathSpec(
-        location='/vss9', parent=self._qcow_path_spec)
-    self.assertFalse(file_system.FileEntryExistsByPathSpec(path_spec))
-
-    file_system.Close()
+    self.assertFalse(file_system.FileEntryExistsByPathSpec(
+        self._vshadow_path_spec_store9))
+    self.assertFalse(file_system.FileEntryExistsByPathSpec(
+        self._vshadow_path_spec_vss0))
+    self.assertFalse(file_system.FileEntryExistsByPathSpec(
+        self._vshadow_path_spec_vss9))
 
   def testGetFileEntryByPathSpec(self):
     """Tests the GetFileEntryByPathSpec function."""
-    file_system = vshadow_file_system.VShadowFileSystem(self._resolver_context)
+    file_system = self._file_system
     self.assertIsNotNone(file_system)
 
-    file_system.Open(self._vshadow_path_spec)
-
-    path_spec = vshadow_path_spec.VShadowPathSpec(
-        location='/', parent=self._qcow_path_spec)
-    file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+    file_entry = file_system.GetFileEntryByPathSpec(self._vshadow_path_spec)
 
     self.assertIsNotNone(file_entry)
     self.assertEqual(file_entry.name, '')
 
-    path_spec = vshadow_path_spec.VShadowPathSpec(
-        parent=self._qcow_path_spec, store_index=1)
-    file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+    file_entry = file_system.GetFileEntryByPathSpec(
+        self._vshadow_path_spec_store1)
 
     self.assertIsNotNone(file_entry)
     self.assertEqual(file_entry.name, 'vss2')
 
-    path_spec = vshadow_path_spec.VShadowPathSpec(
-        location='/vss2', parent=self._qcow_path_spec)
-    file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+    file_entry = file_system.GetFileEntryByPathSpec(
+        self._vshadow_path_spec_vss2)
 
     self.assertIsNotNone(file_entry)
     self.assertEqual(file_entry.name, 'vss2')
 
-    path_spec = vshadow_path_spec.VShadowPathSpec(
-        parent=self._qcow_path_spec, store_index=9)
-    file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+    file_entry = file_system.GetFileEntryByPathSpec(
+        self._vshadow_path_spec_store9)
 
     self.assertIsNone(file_entry)
 
-    path_spec = vshadow_path_spec.VShadowPathSpec(
-        location='/vss0', parent=self._qcow_path_spec)
-    file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+    file_entry = file_system.GetFileEntryByPathSpec(
+        self._vshadow_path_spec_vss0)
 
     self.assertIsNone(file_entry)
 
-    path_spec = vshadow_path_spec.VShadowPathSpec(
-        location='/vss9', parent=self._qcow_path_spec)
-    file_entry = file_system.GetFileEntryByPathSpec(path_spec)
+    file_entry = file_system.GetFileEntryByPathSpec(
+        self._vshadow_path_spec_vss9)
 
     self.assertIsNone(file_entry)
 
-    file_system.Close()
-
   def testGetRootFileEntry(self):
     """Test the get root file entry functionality."""
-    file_system = vshadow_file_system.VShadowFileSystem(self._resolver_context)
+    file_system = self._file_system
     self.assertIsNotNone(file_system)
 
-    file_system.Open(self._vshadow_path_spec)
-
     file_entry = file_system.GetRootFileEntry()
 
     self.assertIsNotNone(file_entry)
     self.assertEqual(file_entry.name, '')
 
-    file_system.Close()
-
   # TODO: add tests for GetVShadowStoreByPathSpec function.
 
 
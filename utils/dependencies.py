@@ -4,7 +4,10 @@
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import concurrent.futures
 import configparser
+import importlib
+import importlib.util
 import re
 
 
@@ -115,6 +118,8 @@ class DependencyHelper(object):
     dependencies (dict[str, DependencyDefinition]): dependencies.
   """
 
+  _MAXIMUM_NUMBER_OF_WORKERS = 8
+
   _VERSION_NUMBERS_REGEX = re.compile(r'[0-9.]+')
   _VERSION_SPLIT_REGEX = re.compile(r'\.|\-')
 
@@ -126,7 +131,9 @@ class DependencyHelper(object):
           configuration file.
     """
     super(DependencyHelper, self).__init__()
+    self._check_result_cache = {}
     self._test_dependencies = {}
+    self._version_map_cache = {}
     self.dependencies = {}
 
     dependency_reader = DependencyDefinitionReader()
@@ -143,6 +150,31 @@ class DependencyHelper(object):
   def _CheckPythonModule(self, dependency):
     """Checks the availability of a Python module.
 
+    The result of a check is cached by name of the dependency, so that
+    a dependency that is checked more than once, such as a dependency shared
+    between the regular and the test dependencies, is only checked once.
+
+    Args:
+      dependency (DependencyDefinition): dependency definition.
+
+    Returns:
+      tuple: containing:
+
+        bool: True if the Python module is available and conforms to
+            the minimum required version, False otherwise.
+        str: status message.
+    """
+    check_result = self._check_result_cache.get(dependency.name, None)
+    if check_result is not None:
+      return check_result
+
+    check_result = self._CheckPythonModuleUncached(dependency)
+    self._check_result_cache[dependency.name] = check_result
+    return check_result
+
+  def _CheckPythonModuleUncached(self, dependency):
+    """Checks the availability of a Python module, bypassing the cache.
+
     Args:
       dependency (DependencyDefinition): dependency definition.
 
@@ -206,14 +238,21 @@ class DependencyHelper(object):
     # A string compare of both version strings will yield an incorrect result.
 
     # Strip any semantic suffixes such as a1, b1, pre, post, rc, dev.
-    module_version = self._VERSION_NUMBERS_REGEX.findall(module_version)[0]
+    # Use search instead of findall so scanning stops at the first match
+    # and no intermediate list of matches is created.
+    match = self._VERSION_NUMBERS_REGEX.search(module_version)
+    if not match:
+      status_message = 'unable to parse module version: {0:s} {1:s}'.format(
+          module_name, module_version)
+      return False, status_message
+
+    module_version = match.group(0)
 
     if module_version[-1] == '.':
       module_version = module_version[:-1]
 
     try:
-      module_version_map = list(
-          map(int, self._VERSION_SPLIT_REGEX.split(module_version)))
+      module_version_map = self._ParseVersionString(module_version)
     except ValueError:
       status_message = 'unable to parse module version: {0:s} {1:s}'.format(
           module_name, module_version)
@@ -221,8 +260,7 @@ class DependencyHelper(object):
 
     if minimum_version:
       try:
-        minimum_version_map = list(
-            map(int, self._VERSION_SPLIT_REGEX.split(minimum_version)))
+        minimum_version_map = self._ParseVersionString(minimum_version)
       except ValueError:
         status_message = 'unable to parse minimum version: {0:s} {1:s}'.format(
             module_name, minimum_version)
@@ -236,8 +274,7 @@ class DependencyHelper(object):
 
     if maximum_version:
       try:
-        maximum_version_map = list(
-            map(int, self._VERSION_SPLIT_REGEX.split(maximum_version)))
+        maximum_version_map = self._ParseVersionString(maximum_version)
       except ValueError:
         status_message = 'unable to parse maximum version: {0:s} {1:s}'.format(
             module_name, maximum_version)
@@ -261,17 +298,43 @@ class DependencyHelper(object):
     Returns:
       module: Python module or None if the module cannot be imported.
     """
+    # Probe for the module first, which is cheaper for a missing module
+    # than the exception and traceback machinery behind an ImportError.
+    try:
+      module_specification = importlib.util.find_spec(module_name)
+    except (ImportError, ValueError):
+      module_specification = None
+
+    if not module_specification:
+      return None
+
     try:
-      module_object = list(map(__import__, [module_name]))[0]
+      return importlib.import_module(module_name)
     except ImportError:
       return None
 
-    # If the module name contains dots get the upper most module object.
-    if '.' in module_name:
-      for submodule_name in module_name.split('.')[1:]:
-        module_object = getattr(module_object, submodule_name, None)
+  def _ParseVersionString(self, version_string):
+    """Parses a version string into a map of integers.
 
-    return module_object
+    The parsed version map is cached since the same minimum and maximum
+    version strings are compared against for multiple modules.
+
+    Args:
+      version_string (str): version string, such as "1.9.2".
+
+    Returns:
+      tuple[int, ...]: integer per version string segment.
+
+    Raises:
+      ValueError: if the version string cannot be parsed.
+    """
+    version_map = self._version_map_cache.get(version_string, None)
+    if version_map is None:
+      version_map = tuple(
+          map(int, self._VERSION_SPLIT_REGEX.split(version_string)))
+      self._version_map_cache[version_string] = version_map
+
+    return version_map
 
   def _PrintCheckDependencyStatus(
       self, dependency, result, status_message, verbose_output=True):
@@ -307,12 +370,19 @@ class DependencyHelper(object):
     print('Checking availability and versions of dependencies.')
     check_result = True
 
-    for _, dependency in sorted(self.dependencies.items()):
-      if dependency.skip_check:
-        continue
+    dependencies = [
+        dependency for _, dependency in sorted(self.dependencies.items())
+        if not dependency.skip_check]
 
-      result, status_message = self._CheckPythonModule(dependency)
+    # Check the modules in parallel since the checks are dominated by
+    # the I/O of importing each module. Note that executor.map returns
+    # the results in the order the dependencies were submitted.
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=self._MAXIMUM_NUMBER_OF_WORKERS) as executor:
+      check_results = list(executor.map(self._CheckPythonModule, dependencies))
 
+    for dependency, (result, status_message) in zip(
+        dependencies, check_results):
       if not result and not dependency.is_optional:
         check_result = False
 
@@ -340,13 +410,18 @@ class DependencyHelper(object):
     print('Checking availability and versions of test dependencies.')
     check_result = True
 
-    for dependency in sorted(
-        self._test_dependencies.values(),
-        key=lambda dependency: dependency.name):
-      if dependency.skip_check:
-        continue
+    dependencies = [
+        dependency for dependency in sorted(
+            self._test_dependencies.values(),
+            key=lambda dependency: dependency.name)
+        if not dependency.skip_check]
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=self._MAXIMUM_NUMBER_OF_WORKERS) as executor:
+      check_results = list(executor.map(self._CheckPythonModule, dependencies))
 
-      result, status_message = self._CheckPythonModule(dependency)
+    for dependency, (result, status_message) in zip(
+        dependencies, check_results):
       if not result:
         check_result = False
 